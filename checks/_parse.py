@@ -0,0 +1,111 @@
+# checks/_parse.py
+# Shared parsing helpers so the checks run against one parse of each page.
+from urllib.parse import urljoin, urlparse
+
+from lxml import html as lxml_html
+
+def get_tree(response):
+    """
+    Returns the lxml root of the page. For Scrapy text responses this is the tree
+    behind response.selector, which the spider has already paid for; anything
+    else is parsed once and cached on response.meta.
+    """
+    if hasattr(response, 'selector'):
+        return response.selector.root
+
+    meta = response.meta
+    tree = meta.get('_lxml_tree')
+    if tree is None:
+        # A fresh parser per call: an explicitly built lxml parser is one shared,
+        # lock-serialized instance, and this path runs on the check thread pool
+        tree = lxml_html.fromstring(response.body, parser=lxml_html.HTMLParser(recover=True))
+        tree = meta.setdefault('_lxml_tree', tree)
+    return tree
+
+# Every tag a check looks up. They are a small fraction of the page's nodes, so one
+# C-level walk collects them all and each check scans only its own short list.
+_INDEXED_TAGS = ('title', 'meta', 'link', 'script', 'h1', 'h2', 'h3', 'img', 'a')
+
+def page_elements(response):
+    """
+    Returns {tag: [elements in document order]} for every tag in _INDEXED_TAGS,
+    collected in a single walk of the page's tree and cached on response.meta.
+    """
+    index = response.meta.get('_page_elements')
+    if index is None:
+        index = {tag: [] for tag in _INDEXED_TAGS}
+        for element in get_tree(response).iter(*_INDEXED_TAGS):
+            index[element.tag].append(element)
+        index = response.meta.setdefault('_page_elements', index)
+    return index
+
+def page_links(response):
+    """
+    Returns (href, absolute_url, parsed_url) for every <a href> on the page, in
+    document order, where absolute_url is href resolved against response.url and
+    parsed_url is its urlparse() result. Built once per page and cached on
+    response.meta, so the link checks share one pass over the anchors.
+    """
+    links = response.meta.get('_page_links')
+    if links is None:
+        # Navigation and footer links repeat; resolve each distinct href only once
+        resolved = {}
+        links = []
+        for anchor in page_elements(response)['a']:
+            href = anchor.get('href')
+            if href is None:
+                continue
+            entry = resolved.get(href)
+            if entry is None:
+                url = urljoin(response.url, href)
+                entry = resolved[href] = (href, url, urlparse(url))
+            links.append(entry)
+        links = response.meta.setdefault('_page_links', links)
+    return links
+
+def node_text(element):
+    """lxml equivalent of bs4's tag.get_text(strip=True): stripped text pieces, joined."""
+    return ''.join(text.strip() for text in element.itertext())
+
+# Elements whose strings bs4 never counted as page text (Script, Stylesheet and
+# TemplateString are left out of soup.strings); comments are skipped as well
+_NON_TEXT_TAGS = frozenset(('script', 'style', 'template'))
+
+def visible_text(tree, skip_tags):
+    """
+    Equivalent of soup.get_text(separator=' ', strip=True) after decomposing every
+    tag named in skip_tags: the stripped text pieces outside those tags, joined by
+    single spaces. Computed in one walk without modifying the shared tree.
+    """
+    skip_tags = frozenset(skip_tags) | _NON_TEXT_TAGS
+    parts = []
+    # Depth-first walk with an explicit stack; a (node, True) entry marks the point
+    # where the node's subtree is done and its tail text (which belongs to the
+    # parent) comes next. Comments have no subtree and a non-str tag, so only their
+    # tail is kept.
+    stack = [(tree, False)]
+    while stack:
+        node, closed = stack.pop()
+        if not closed:
+            if node.tag not in skip_tags:
+                if isinstance(node.tag, str) and node.text:
+                    parts.append(node.text)
+                stack.append((node, True))
+                stack.extend((child, False) for child in reversed(node))
+                continue
+        if node.tail and node is not tree:
+            parts.append(node.tail)
+    parts = [text.strip() for text in parts]
+    return ' '.join(text for text in parts if text)
+
+def page_text(response, skip_tags):
+    """
+    Returns visible_text() of the page's shared tree for skip_tags, computed once per
+    page and tag set: checks that strip the same noise share one walk of the tree.
+    """
+    key = frozenset(skip_tags)
+    texts = response.meta.setdefault('_visible_text', {})
+    text = texts.get(key)
+    if text is None:
+        text = texts.setdefault(key, visible_text(get_tree(response), key))
+    return text
@@ -1,5 +1,9 @@
 # checks/accessibility_check.py
-from bs4 import BeautifulSoup
+from lxml import etree
+from ._parse import get_tree
+
+# Compiled once at import and reused for every page
+_ARIA_XPATH = etree.XPath('boolean(//*[@role or @*[starts-with(name(), "aria-")]])')
 
 def run_audit(response, audit_level):
     """
@@ -9,20 +13,20 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # Work on the lxml tree Scrapy already built for the rendered response
+        tree = get_tree(response)
     except Exception as e:
         return {"error": f"Failed to parse content for accessibility check: {str(e)}"}
     
     issues = []
     
     # 1. HTML Lang Attribute Check (CRITICAL)
-    html_tag = soup.find('html')
-    lang_attribute = html_tag.get('lang') if html_tag else None
+    html_tag = next(tree.iter('html'), None)
+    lang_attribute = html_tag.get('lang') if html_tag is not None else None
     
     lang_found = False
     
-    if not html_tag:
+    if html_tag is None:
         issues.append({"type": "error", "check": "Missing <html> Tag", "details": "The HTML document structure is invalid or missing."})
     elif not lang_attribute:
         issues.append({"type": "error", "check": "Missing or Empty `lang` Attribute", "details": "The `<html lang=\"...\">` attribute is required for accessibility and multilingual SEO."})
@@ -36,7 +40,7 @@ def run_audit(response, audit_level):
 
     # 2. Basic ARIA Check (Presence of ARIA is an indicator of effort)
     # Check for presence of `role` attribute or other ARIA attributes
-    aria_found = bool(soup.find(attrs={"role": True})) or bool(soup.find(attrs=lambda x: x and x.startswith('aria-')))
+    aria_found = _ARIA_XPATH(tree)
     
     
     # Final Summary Note
@@ -1,10 +1,15 @@
 # checks/analytics_check.py
 import re
-from bs4 import BeautifulSoup
+from ._parse import page_elements
 
 # Regex to find Google Analytics (UA- or G-) and Google Tag Manager (GTM-) IDs
 GA_RE = re.compile(r'UA-\d{4,9}-\d{1,4}|G-[A-Z0-9]{8}')
 GTM_RE = re.compile(r'GTM-[A-Z0-9]{5,7}')
+# All script-content signals in one alternation, so each script body is scanned once
+# (the alternatives cannot overlap, so the leftmost match per kind is unchanged)
+TRACKING_RE = re.compile(
+    r'(?P<ga>UA-\d{4,9}-\d{1,4}|G-[A-Z0-9]{8})|(?P<gtm>GTM-[A-Z0-9]{5,7})|(?P<other>fbq|_hj)'
+)
 
 def run_audit(response, audit_level):
     """
@@ -12,8 +17,8 @@ def run_audit(response, audit_level):
     using the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # 💡 FIX: Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's <script> elements, collected in the shared single walk
+        scripts = page_elements(response)["script"]
     except Exception as e:
         return {"error": f"Failed to parse content for analytics check: {str(e)}"}
     
@@ -26,7 +31,7 @@ def run_audit(response, audit_level):
     }
     
     # Check all <script> tags for GTM/GA codes
-    for script in soup.find_all("script"):
+    for script in scripts:
         
         # 1. Check for GTM by src attribute
         src = script.get("src", "")
@@ -37,25 +42,26 @@ def run_audit(response, audit_level):
                 tracking["gtm_id"] = match.group(0)
             
         # 2. Check for GA/GTM/Other in the script content
-        script_content = script.string if script.string else ""
+        script_content = script.text or ""
         
-        # Check for Google Analytics ID (UA- or G-)
-        if not tracking["google_analytics_found"]:
-            match = GA_RE.search(script_content)
-            if match:
-                tracking["google_analytics_found"] = True
-                tracking["ga_id"] = match.group(0)
-            
-        # Check for Google Tag Manager ID in dataLayer initialization
-        if not tracking["google_tag_manager_found"]:
-            match = GTM_RE.search(script_content)
-            if match:
-                tracking["google_tag_manager_found"] = True
-                tracking["gtm_id"] = match.group(0)
+        # Single pass over the content for GA IDs (UA- or G-), GTM IDs in dataLayer
+        # initialization, and other common third-party scripts (Facebook Pixel, Hotjar)
+        for match in TRACKING_RE.finditer(script_content):
+            kind = match.lastgroup
+            if kind == "ga":
+                if not tracking["google_analytics_found"]:
+                    tracking["google_analytics_found"] = True
+                    tracking["ga_id"] = match.group(0)
+            elif kind == "gtm":
+                if not tracking["google_tag_manager_found"]:
+                    tracking["google_tag_manager_found"] = True
+                    tracking["gtm_id"] = match.group(0)
+            else:
+                tracking["other_analytics_found"] = True
 
-        # Check for other common third-party scripts (e.g., Facebook Pixel, Hotjar)
-        if "fbq" in script_content or "_hj" in script_content:
-             tracking["other_analytics_found"] = True
+            if (tracking["google_analytics_found"] and tracking["google_tag_manager_found"]
+                    and tracking["other_analytics_found"]):
+                break
             
     
     # Final Note
@@ -1,8 +1,11 @@
 # checks/backlinks_check.py
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+from ._parse import page_links
+from urllib.parse import urlparse
 import re
 
+# Non-navigational link schemes
+_NON_HTTP_RE = re.compile(r'^(mailto|tel|javascript):')
+
 def run_audit(response, audit_level):
     """
     Free backlink-like check. Counts internal/external links found on the page 
@@ -11,8 +14,8 @@ def run_audit(response, audit_level):
     NOTE: Real backlink data requires external APIs (e.g., Ahrefs, Moz).
     """
     try:
-        # Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # Anchors are resolved once per page and shared with the other link checks
+        links = page_links(response)
     except Exception as e:
         return {"error": f"Failed to parse content for backlink proxy check: {str(e)}"}
         
@@ -21,16 +24,10 @@ def run_audit(response, audit_level):
     internal_links = []
     external_links = []
 
-    for tag in soup.find_all("a", href=True):
-        href = tag.get("href")
-        
-        if not href or re.match(r'^(mailto|tel|javascript):', href):
+    for href, absolute_url, parsed_url in links:
+        if not href or _NON_HTTP_RE.match(href):
             continue
 
-        # Resolve the URL to handle relative paths
-        absolute_url = urljoin(response.url, href)
-        parsed_url = urlparse(absolute_url)
-
         # Skip links without a network location (e.g., #fragments)
         if not parsed_url.netloc:
             continue
@@ -1,17 +1,14 @@
 # checks/canonical_check.py
-from bs4 import BeautifulSoup
+from ._parse import page_elements
 from urllib.parse import urlparse, urlunparse
 
-def _get_soup(response):
+def _link_href(links, rel):
     """
-    Creates a BeautifulSoup object from the response body.
-    NOTE: When the spider uses Playwright, response.body contains the 
-    fully JavaScript-rendered content, making this check robust for 
-    all page types (static, dynamic, JS-driven).
+    Returns the non-empty href of the first <link> whose rel list contains rel
+    (rel is space-separated, so rel="canonical nofollow" still counts), or None.
     """
-    # Use 'lxml' for speed and response.text (or response.body) for content
-    return BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
-
+    tag = next((link for link in links if rel in (link.get('rel') or '').split()), None)
+    return (tag.get('href') or None) if tag is not None else None
 
 def _clean_url(url):
     """
@@ -36,18 +33,17 @@ def run_audit(response, audit_level):
     Runs the Canonical Check against the fully rendered HTML provided by the Spider.
     """
     try:
-        soup = _get_soup(response)
+        # NOTE: When the spider uses Playwright, the response holds the fully
+        # JavaScript-rendered content, so this works for static and JS-driven pages.
+        links = page_elements(response)['link']
     except Exception as e:
         return {"error": f"Failed to parse content for canonical check: {str(e)}"}
 
 
     current_url = response.url
-    # Find the canonical tag using a CSS selector for robustness
-    canonical_tag = soup.find('link', rel='canonical')
-    canonical_url = canonical_tag.get('href') if canonical_tag and canonical_tag.get('href') else None
-    
-    amphtml_tag = soup.find('link', rel='amphtml')
-    amphtml_url = amphtml_tag.get('href') if amphtml_tag and amphtml_tag.get('href') else None
+    # Find the canonical and AMP alternate tags among the page's <link> elements
+    canonical_url = _link_href(links, 'canonical')
+    amphtml_url = _link_href(links, 'amphtml')
     
     is_amp_page = '/amp/' in current_url.lower()
     canonical_mismatch = False
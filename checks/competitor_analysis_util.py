@@ -1,23 +1,44 @@
 # checks/competitor_analysis_util.py
 
+import codecs
 import logging
 from urllib.parse import urlparse
 import requests 
-from bs4 import BeautifulSoup 
+import lxml.html as lxml_html
+from w3lib.encoding import html_body_declared_encoding, http_content_type_encoding
 
 # Simple fetcher function for external URL (competitor)
 def fetch_html(url: str):
-    """Fetches the HTML content of the target URL."""
+    """
+    Fetches the raw HTML bytes of the target URL, with its Content-Type header so
+    the caller can pick the encoding to parse them with.
+    """
     try:
         # Use a descriptive User-Agent
         headers = {'User-Agent': 'Mozilla/5.0 (compatible; SEO Audit Bot/1.0; +https://your-github.com/repo)'}
         # Set a short timeout as this is a preliminary check
         response = requests.get(url, headers=headers, timeout=10) 
         response.raise_for_status() # Raise HTTPError for bad responses (4xx or 5xx)
-        return response.text, response.status_code
+        return response.content, response.headers.get('Content-Type'), response.status_code
     except requests.exceptions.RequestException as e:
         logging.error(f"Error fetching {url}: {e}")
-        return None, 0
+        return None, None, 0
+
+def _parse_html(body: bytes, encoding: str):
+    """
+    Parses the HTML bytes with lxml in the given encoding. libxml2 does not know every
+    codec name Python does (e.g. 'mac-roman'), so those are decoded in Python first;
+    an encoding neither knows falls back to UTF-8.
+    """
+    try:
+        parser = lxml_html.HTMLParser(encoding=encoding)
+    except LookupError:
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            encoding = 'utf-8'
+        return lxml_html.fromstring(body.decode(encoding, 'replace'))
+    return lxml_html.fromstring(body, parser=parser)
 
 def run_competitor_audit(competitor_url: str) -> dict:
     """
@@ -28,7 +49,7 @@ def run_competitor_audit(competitor_url: str) -> dict:
         return {'competitor_analysis': {'status': 'INFO', 'details': 'No COMPETITOR_URL provided.', 'competitor_data': {}}}
 
     logging.info(f"Running competitor audit for: {competitor_url}")
-    html_content, status_code = fetch_html(competitor_url)
+    html_content, content_type, status_code = fetch_html(competitor_url)
 
     analysis_data = {'http_status': status_code, 'url': competitor_url}
 
@@ -40,19 +61,22 @@ def run_competitor_audit(competitor_url: str) -> dict:
         }}
 
     try:
-        soup = BeautifulSoup(html_content, 'lxml')
+        # Parse the fetched bytes directly, in the encoding the server or the page
+        # declares (UTF-8 otherwise), instead of decoding the whole body to str first
+        encoding = (http_content_type_encoding(content_type)
+                    or html_body_declared_encoding(html_content) or 'utf-8')
+        tree = _parse_html(html_content, encoding)
         
         # 1. Title Check
-        title_tag = soup.find('title')
-        comp_title = title_tag.text.strip() if title_tag else "MISSING"
+        title_tag = next(tree.iter('title'), None)
+        comp_title = title_tag.text_content().strip() if title_tag is not None else "MISSING"
         
         # 2. H1 Check
-        h1_tags = soup.find_all('h1')
-        h1_count = len(h1_tags)
+        h1_count = sum(1 for _ in tree.iter('h1'))
         
         # 3. Meta Description Check
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        comp_meta_desc_len = len(meta_desc['content'].strip()) if meta_desc and 'content' in meta_desc else 0
+        meta_desc = next((tag for tag in tree.iter('meta') if tag.get('name') == 'description'), None)
+        comp_meta_desc_len = len((meta_desc.get('content') or '').strip()) if meta_desc is not None else 0
         
         # Output Results
         analysis_data.update({
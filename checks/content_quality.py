@@ -1,5 +1,5 @@
 # checks/content_quality.py
-from bs4 import BeautifulSoup
+from ._parse import page_text
 import textstat
 # NOTE: textstat requires the nltk and textblob dependencies to be installed
 # (as confirmed in the main.py file imports and GitHub Actions file)
@@ -12,20 +12,16 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # 💡 FIX: Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # Skip scripts, styles, and other noise to get clean, visible text.
+        # The text comes from the page's shared tree and is shared with other checks
+        # that strip the same tags (e.g. local_seo_check).
+        text = page_text(response, ["script", "style", "header", "footer", "nav", "noscript"])
     except Exception as e:
         return {"error": f"Failed to parse content for quality check: {str(e)}"}
     
-    # Strip scripts, styles, and other noise to get clean, visible text
-    for script_or_style in soup(["script", "style", "header", "footer", "nav", "noscript"]):
-        script_or_style.decompose()
-
-    text = soup.get_text(separator=' ', strip=True)
-    
-    # Clean up excessive whitespace created by decomposition
-    clean_text = ' '.join(text.split())
-    word_count = len(clean_text.split())
+    # Count words on the whitespace-split text (not text nodes)
+    words = text.split()
+    word_count = len(words)
     
     # Determine if content is thin (commonly defined as < 200 words)
     thin_content_flag = word_count < 200
@@ -35,6 +31,8 @@ def run_audit(response, audit_level):
 
     try:
         if word_count > 100: # Score is often unreliable for very short texts
+            # Clean up excessive whitespace only when the text is actually scored
+            clean_text = ' '.join(words)
             # Flesch Reading Ease: Higher score is easier to read (aim for 60-70)
             readability_score = textstat.flesch_reading_ease(clean_text)
             readability = f"{readability_score:.2f}"
@@ -1,5 +1,5 @@
 # checks/heading_check.py
-from bs4 import BeautifulSoup
+from ._parse import node_text, page_elements
 
 def run_audit(response, audit_level):
     """
@@ -9,18 +9,18 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's headings, collected in the shared single walk
+        elements = page_elements(response)
     except Exception as e:
         return {"error": f"Failed to parse content for heading check: {str(e)}"}
     
     # 1. H1 Check
-    h1_tags = soup.find_all('h1')
+    h1_tags = elements['h1']
     h1_count = len(h1_tags)
     h1_fail = False
     
     # Extract the text content of the H1 tags for the report
-    h1_content = [tag.get_text(strip=True) for tag in h1_tags]
+    h1_content = [node_text(tag) for tag in h1_tags]
     
     if h1_count == 0:
         h1_fail = True
@@ -32,8 +32,8 @@ def run_audit(response, audit_level):
         h1_status = "PASS: Page has exactly one H1 tag."
 
     # 2. H2 and H3 presence check (basic structural level)
-    h2_present = len(soup.find_all('h2')) > 0
-    h3_present = len(soup.find_all('h3')) > 0
+    h2_present = bool(elements['h2'])
+    h3_present = bool(elements['h3'])
     
     # Simple check for skipping major levels (e.g., H1 -> H3 without H2)
     skipped_levels = False
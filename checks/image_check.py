@@ -1,5 +1,5 @@
 # checks/image_check.py
-from bs4 import BeautifulSoup
+from ._parse import page_elements
 
 def run_audit(response, audit_level):
     """
@@ -8,13 +8,13 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # 💡 FIX: Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's elements, collected in the shared single walk
+        elements = page_elements(response)
     except Exception as e:
         return {"error": f"Failed to parse content for image check: {str(e)}"}
     
     # Find all image tags
-    imgs = soup.find_all("img")
+    imgs = elements["img"]
     
     # 1. Filter out images that don't have a source (e.g., base64 or placeholder) and count the rest
     real_images = [
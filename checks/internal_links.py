@@ -1,6 +1,6 @@
 # checks/internal_links.py
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+from ._parse import page_links
+from urllib.parse import urlparse
 
 def run_audit(response, audit_level):
     """
@@ -9,8 +9,8 @@ def run_audit(response, audit_level):
     It determines the domain of the current page for accurate classification.
     """
     try:
-        # Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # Anchors are resolved once per page and shared with the other link checks
+        links = page_links(response)
     except Exception as e:
         return {"error": f"Failed to parse content for internal links check: {str(e)}"}
     
@@ -19,13 +19,8 @@ def run_audit(response, audit_level):
     
     internal_links = []
     
-    # Find all anchor tags with an href attribute
-    for a in soup.find_all('a', href=True):
-        href = a['href']
-        
-        # 1. Resolve relative links to absolute URLs
-        absolute_url = urljoin(response.url, href)
-        parsed_url = urlparse(absolute_url)
+    # Every anchor tag with an href attribute, already resolved to an absolute URL
+    for href, absolute_url, parsed_url in links:
         
         # Ignore non-standard links (mailto, tel, javascript)
         if parsed_url.scheme not in ['http', 'https']:
@@ -1,7 +1,9 @@
 # checks/keyword_analysis.py
 from textstat.textstat import textstatistics
-from bs4 import BeautifulSoup
+from ._parse import node_text, page_elements, page_text
 from collections import Counter
+from heapq import nlargest
+from operator import itemgetter
 import re
 
 # FIX: Expanded STOP_WORDS list to include critical missing ones like 'by', 'from', 'as', etc.
@@ -13,39 +15,36 @@ STOP_WORDS = set([
     'out', 'into', 'over', 'under', 'through', 'after', 'before'
 ])
 
+# A maximal run of word characters always sits between word boundaries, so plain \w+
+# finds exactly the tokens \b\w+\b did, without the boundary assertions.
+_WORD_RE = re.compile(r'\w+')
+
 def get_word_frequency_and_ngrams(text, top_n=10):
     """Calculates frequency for single words and N-grams (2, 3 words), excluding common stop words."""
     if not text:
         return []
 
-    # Tokenize and clean text using regex to get full words only
-    words = [word.lower() for word in re.findall(r'\b\w+\b', text) if word.isalpha()]
-    
-    # Filter out stop words from the main list
-    clean_words = [word for word in words if word not in STOP_WORDS]
+    # Tokenize and clean text using regex to get full words only,
+    # filtering out stop words in the same pass
+    clean_words = [
+        word for word in (token.lower() for token in _WORD_RE.findall(text) if token.isalpha())
+        if word not in STOP_WORDS
+    ]
     
     # 1. Single Word Frequency
-    word_counts = Counter(clean_words)
-    
-    # 2. N-Gram (2-word and 3-word phrase) Frequency
-    final_counts = word_counts.copy()
+    final_counts = Counter(clean_words)
     
-    # 2-grams
-    ngrams_2 = [' '.join(clean_words[i:i+2]) for i in range(len(clean_words) - 1)]
-    final_counts.update(Counter(ngrams_2))
-    
-    # 3-grams
-    ngrams_3 = [' '.join(clean_words[i:i+3]) for i in range(len(clean_words) - 2)]
-    final_counts.update(Counter(ngrams_3))
+    # 2. N-Gram (2-word and 3-word phrase) Frequency.
+    # Counter.update on an iterable counts in C, with no intermediate n-gram lists.
+    final_counts.update(f"{a} {b}" for a, b in zip(clean_words, clean_words[1:]))
+    final_counts.update(f"{a} {b} {c}" for a, b, c in zip(clean_words, clean_words[1:], clean_words[2:]))
 
-    # Sort by count (highest first)
-    sorted_counts = sorted(final_counts.items(), key=lambda item: item[1], reverse=True)
-    
     # Filter out any final keywords that are single, very short, and not the start of a phrase
     # E.g., removes single letters or very common short words that were missed by stop-word filter
-    sorted_counts = [(k, v) for k, v in sorted_counts if len(k) > 2 or ' ' in k]
+    candidates = ((k, v) for k, v in final_counts.items() if len(k) > 2 or ' ' in k)
 
-    return sorted_counts[:top_n]
+    # Highest counts first; nlargest keeps the same (stable) order as a full sort + slice
+    return nlargest(top_n, candidates, key=itemgetter(1))
 
 
 def run_checks(title, description, content, h1_tags, level):
@@ -54,8 +53,9 @@ def run_checks(title, description, content, h1_tags, level):
     results = {}
     
     # Clean up excessive whitespace in content
-    clean_content = ' '.join(content.split())
-    total_words = len(clean_content.split())
+    content_words = content.split()
+    clean_content = ' '.join(content_words)
+    total_words = len(content_words)
     
     # 1. Word/N-gram Frequency Check 
     top_keywords = get_word_frequency_and_ngrams(clean_content)
@@ -130,27 +130,25 @@ def run_audit(response, audit_level):
     Wrapper function to extract data from the Scrapy response and run keyword analysis checks.
     """
     try:
-        # Use response.body for robust parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
-        content_soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's title, meta and h1 elements, collected in the shared single walk
+        elements = page_elements(response)
     except Exception as e:
         return {"error": f"Failed to parse content for keyword analysis: {str(e)}"}
     
     # 1. Extract Title
-    title = soup.find('title').get_text(strip=True) if soup.find('title') else ""
+    title_tag = next(iter(elements['title']), None)
+    title = node_text(title_tag) if title_tag is not None else ""
 
     # 2. Extract Meta Description
-    desc_tag = soup.find('meta', attrs={'name': 'description'})
-    description = desc_tag.get('content', '') if desc_tag else ""
+    desc_tag = next((tag for tag in elements['meta'] if tag.get('name') == 'description'), None)
+    description = desc_tag.get('content', '') if desc_tag is not None else ""
 
     # 3. Extract Content (Text after removing noise)
-    # Strip scripts, styles, and other noise
-    for script_or_style in content_soup(["script", "style", "header", "footer", "nav", "aside", "noscript"]):
-        script_or_style.decompose()
-    content = content_soup.get_text(separator=' ', strip=True)
+    # Skip scripts, styles, and other noise without touching the shared tree
+    content = page_text(response, ["script", "style", "header", "footer", "nav", "aside", "noscript"])
 
     # 4. Extract H1 Tags
-    h1_tags = [h.get_text(strip=True) for h in soup.find_all('h1')]
+    h1_tags = [node_text(h) for h in elements['h1']]
     
     # Run the core logic with the extracted data
     return run_checks(title, description, content, h1_tags, audit_level)
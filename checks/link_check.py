@@ -1,8 +1,8 @@
 # checks/link_check.py
 
 import requests 
-from bs4 import BeautifulSoup
-from urllib.parse import urlparse, urljoin
+from ._parse import page_links
+from urllib.parse import urlparse
 
 # Use a requests Session for slight efficiency and connection pooling across checks
 # This is still synchronous and a potential bottleneck, but it is the cleaner way
@@ -20,21 +20,21 @@ def run_audit(response, audit_level):
     
     # 1. Parsing the Rendered HTML
     try:
-        # 💡 FIX: Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # Anchors are resolved once per page and shared with the other link checks
+        links = page_links(response)
     except Exception as e:
         return {"error": f"Failed to parse content for link check: {str(e)}"}
     
     # 2. Extracting and Classifying Links
-    links = [a.get("href") for a in soup.find_all("a", href=True) if a.get("href")]
     
     internal_count = 0
     external_links_to_check = set() # Use a set to check unique external links only
     current_netloc = urlparse(response.url).netloc
 
-    for href in links:
-        url = urljoin(response.url, href)
-        parsed_url = urlparse(url)
+    for href, url, parsed_url in links:
+        # Empty href attributes are not links
+        if not href:
+            continue
         
         # Ignore non-HTTP/HTTPS links (e.g., mailto, tel, javascript)
         if parsed_url.scheme not in ['http', 'https']:
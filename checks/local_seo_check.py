@@ -1,5 +1,5 @@
 # checks/local_seo_check.py
-from bs4 import BeautifulSoup
+from ._parse import page_elements, page_text
 import json
 import re
 
@@ -20,17 +20,17 @@ def run_audit(response, audit_level) -> dict:
     }
 
     try:
-        # Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's <script> elements, collected in the shared single walk
+        scripts = page_elements(response)["script"]
         
         # --- Check 1: Schema.org LocalBusiness Markup ---
         schema_status = "No Relevant Schema Found"
         
         # Look for application/ld+json script tags
-        schema_tags = soup.find_all("script", type="application/ld+json")
+        schema_tags = [tag for tag in scripts if tag.get("type") == "application/ld+json"]
         
         for tag in schema_tags:
-            content = tag.string.strip() if tag.string else ""
+            content = tag.text.strip() if tag.text else ""
             if not content:
                 continue
 
@@ -67,9 +67,7 @@ def run_audit(response, audit_level) -> dict:
 
         # --- Check 2: NAP (Name, Address, Phone) Presence ---
         # Get the full *visible* text content (after stripping noise)
-        for script_or_style in soup(["script", "style", "header", "footer", "nav", "noscript"]):
-            script_or_style.decompose()
-        full_text = soup.get_text(separator=' ', strip=True).lower()
+        full_text = page_text(response, ["script", "style", "header", "footer", "nav", "noscript"]).lower()
         
         
         # Simple regex for finding key NAP components (high false positive rate, but good for flags)
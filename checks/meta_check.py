@@ -1,5 +1,5 @@
 # checks/meta_check.py
-from bs4 import BeautifulSoup
+from ._parse import node_text, page_elements
 import re
 
 def run_audit(response, audit_level):
@@ -8,14 +8,15 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # 💡 FIX: Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's title and meta elements, collected in the shared single walk
+        elements = page_elements(response)
     except Exception as e:
         return {"error": f"Failed to parse content for meta check: {str(e)}"}
 
 
     # --- 1. Title Tag Check ---
-    title = soup.find('title').get_text(strip=True) if soup.find('title') else ""
+    title_tag = next(iter(elements['title']), None)
+    title = node_text(title_tag) if title_tag is not None else ""
     title_length = len(title)
     
     title_fail = False
@@ -34,10 +35,10 @@ def run_audit(response, audit_level):
 
     # --- 2. Meta Description Check ---
     # Find all meta tags named 'description' and prioritize the first one
-    desc_tag = soup.find("meta", attrs={"name": "description"})
+    desc_tag = next((tag for tag in elements['meta'] if tag.get('name') == 'description'), None)
     
     # Use .get('content') defensively
-    description = desc_tag.get("content").strip() if desc_tag and desc_tag.get("content") else ""
+    description = desc_tag.get("content").strip() if desc_tag is not None and desc_tag.get("content") else ""
     desc_length = len(description)
     
     desc_fail = False
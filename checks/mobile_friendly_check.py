@@ -1,5 +1,5 @@
 # checks/mobile_friendly_check.py
-from bs4 import BeautifulSoup
+from ._parse import page_elements
 import re
 
 def run_audit(response, audit_level):
@@ -10,16 +10,16 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's <meta> elements, collected in the shared single walk
+        metas = page_elements(response)['meta']
     except Exception as e:
         return {"error": f"Failed to parse content for mobile check: {str(e)}"}
     
-    viewport = soup.find("meta", attrs={"name": "viewport"})
+    viewport = next((tag for tag in metas if tag.get('name') == 'viewport'), None)
     issues = []
     
     # Critical Check: Presence of the tag
-    if not viewport:
+    if viewport is None:
         issues.append("ERROR: Missing viewport meta tag.")
     else:
         content = viewport.get("content", "").lower()
@@ -44,7 +44,7 @@ def run_audit(response, audit_level):
         note = "FAIL: Missing or incorrect viewport configuration. Critical for mobile-first indexing."
 
     return {
-        "viewport_content": viewport.get("content") if viewport else "MISSING",
+        "viewport_content": viewport.get("content") if viewport is not None else "MISSING",
         "is_mobile_friendly": is_mobile_friendly,
         "mobile_unfriendly_count": 0 if is_mobile_friendly else 1,
         "issues_list": issues,
@@ -1,40 +1,44 @@
 # checks/og_tags_check.py
-from bs4 import BeautifulSoup
+from ._parse import page_elements
+
+# Tags every page should carry for rich social sharing previews
+_REQ_OG = frozenset(('og:title', 'og:description', 'og:type', 'og:url', 'og:image'))
+_REQ_TW = frozenset(('twitter:card', 'twitter:title', 'twitter:description', 'twitter:image'))
+
+_REQUIRED = _REQ_OG | _REQ_TW
 
 def run_audit(response, audit_level):
     """
     Checks for the presence of Open Graph (OG) and Twitter Card tags.
     """
+    og_tags = {}
+    
+    # 1. Scan the page's <meta> elements, collected in the shared single walk;
+    # stop as soon as every required tag has been seen.
     try:
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        metas = page_elements(response)['meta']
     except Exception as e:
         return {"error": f"Failed to parse content for OG tag check: {str(e)}"}
-        
-    og_tags = {}
-    
-    # CRITICAL FIX: Use 'property' and 'name' in a dictionary filter for robust tag finding.
-    # The error was caused by passing multiple arguments incorrectly.
-    required_og = ['og:title', 'og:description', 'og:type', 'og:url', 'og:image']
-    required_twitter = ['twitter:card', 'twitter:title', 'twitter:description', 'twitter:image']
-    
-    all_tags = []
-    
-    # 1. Find Open Graph tags
-    all_tags.extend(soup.find_all('meta', property=lambda x: x and x.startswith('og:')))
-    
-    # 2. Find Twitter tags
-    all_tags.extend(soup.find_all('meta', name=lambda x: x and x.startswith('twitter:')))
 
-    for tag in all_tags:
-        # Prioritize 'property' for OG tags, fallback to 'name' for Twitter tags
-        key = tag.get('property') or tag.get('name')
+    for tag in metas:
+        # Open Graph tags use 'property', Twitter Card tags use 'name'
+        prop = tag.get('property') or ''
+        if prop.startswith('og:'):
+            key = prop
+        else:
+            key = tag.get('name') or ''
+            if not key.startswith('twitter:'):
+                continue
         content = tag.get('content')
-        if key and content:
+        if content:
             og_tags[key] = content
+            if _REQUIRED <= og_tags.keys():
+                break
 
-    # 3. Validation Logic
-    missing_og = [tag for tag in required_og if tag not in og_tags]
-    missing_twitter = [tag for tag in required_twitter if tag not in og_tags]
+    # 2. Validation Logic
+    present = og_tags.keys()
+    missing_og = sorted(_REQ_OG - present)
+    missing_twitter = sorted(_REQ_TW - present)
     
     # Combine failures for aggregation
     og_tags_fail_count = len(missing_og) + len(missing_twitter)
@@ -1,7 +1,64 @@
 # checks/robots_sitemap.py
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 
+# Shared session so the robots.txt and sitemap.xml probes to the same host reuse
+# one keep-alive connection instead of paying a new TCP/TLS handshake each time.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+
+# (connect, read) timeouts: a host that cannot complete the handshake fails fast
+_TIMEOUT = (2, 3)
+
+def _file_status(url):
+    """Returns 'found', 'not found' or 'error or timeout' for a HEAD probe of url."""
+    try:
+        # Use HEAD request for speed. Only the first status code matters: a redirect
+        # (e.g. to a sitemap index) counts as found, so the chain is not followed.
+        status_code = _SESSION.head(url, timeout=_TIMEOUT, allow_redirects=False).status_code
+        return "found" if 200 <= status_code < 400 else "not found"
+    except: 
+        return "error or timeout"
+
+# Both files are per-host, so every page of the same site reuses the first probe.
+# Entries are (robots, sitemap) future pairs, so probes started by prefetch() are
+# awaited rather than repeated.
+_PROBE_CACHE = {}
+_PROBE_CACHE_LOCK = threading.Lock()
+
+# Background workers for the probes; robots.txt and sitemap.xml are submitted as
+# separate jobs, so the two network waits run side by side
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix='robots_sitemap')
+
+def reset_cache():
+    """Forgets all memoized host results (called when a new crawl starts)."""
+    with _PROBE_CACHE_LOCK:
+        _PROBE_CACHE.clear()
+
+def prefetch(url):
+    """
+    Starts the robots.txt and sitemap.xml probes for url's host in the background and
+    returns their (robots, sitemap) futures. The spider calls this when it schedules
+    the start request, so the probes overlap with browser start-up and the first
+    page render.
+    """
+    parsed_url = urlparse(url)
+    base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+    with _PROBE_CACHE_LOCK:
+        futures = _PROBE_CACHE.get(base_url)
+        if futures is None:
+            futures = (
+                _EXECUTOR.submit(_file_status, f"{base_url}/robots.txt"),
+                _EXECUTOR.submit(_file_status, f"{base_url}/sitemap.xml"),
+            )
+            _PROBE_CACHE[base_url] = futures
+    return futures
+
 # FIX: Changed function name and arguments to match the spider's requirement
 def run_audit(response, audit_level):
     """
@@ -11,26 +68,9 @@ def run_audit(response, audit_level):
     This check relies on file existence and does not require HTML parsing.
     """
     
-    # Get the base domain from the current URL
-    parsed_url = urlparse(response.url)
-    base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-    
-    robots_url = f"{base_url}/robots.txt"
-    sitemap_url = f"{base_url}/sitemap.xml"
-    
-    # --- Robots.txt Check ---
-    try:
-        # Use HEAD request for speed, check for a 200 OK status
-        r_status = "found" if requests.head(robots_url, timeout=5).status_code == 200 else "not found"
-    except: 
-        r_status = "error or timeout"
-        
-    # --- Sitemap.xml Check ---
-    try:
-        # Use HEAD request for speed, check for a 200 OK status
-        s_status = "found" if requests.head(sitemap_url, timeout=5).status_code == 200 else "not found"
-    except: 
-        s_status = "error or timeout"
+    # --- Robots.txt and Sitemap.xml Checks (cached per host) ---
+    robots_future, sitemap_future = prefetch(response.url)
+    r_status, s_status = robots_future.result(), sitemap_future.result()
         
     # Calculate failure count
     fail_count = 0
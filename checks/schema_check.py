@@ -1,7 +1,35 @@
 # checks/schema_check.py
-from bs4 import BeautifulSoup
-import json
 import re
+import orjson
+
+from ._parse import page_elements
+
+# Keys whose values commonly hold further schema entities (Yoast/RankMath use @graph)
+_NESTED_KEYS = ('@graph', 'itemListElement', 'mainEntity', 'item', 'hasPart')
+
+def _collect_types(obj, out, max_depth=6):
+    """
+    Adds every '@type' found in a decoded JSON-LD value to the out set.
+    Uses an explicit stack bounded by max_depth instead of recursion.
+    """
+    stack = [(obj, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, list):
+            if depth < max_depth:
+                stack.extend((child, depth + 1) for child in node)
+        elif isinstance(node, dict):
+            # Handle single type or array of types (e.g., '@type': ['Article', 'NewsArticle'])
+            schema_type = node.get('@type')
+            if isinstance(schema_type, str):
+                out.add(schema_type)
+            elif isinstance(schema_type, list):
+                out.update(t for t in schema_type if isinstance(t, str))
+            if depth < max_depth:
+                for key in _NESTED_KEYS:
+                    child = node.get(key)
+                    if child is not None:
+                        stack.append((child, depth + 1))
 
 def run_audit(response, audit_level):
     """
@@ -11,52 +39,38 @@ def run_audit(response, audit_level):
     This check uses the fully rendered HTML provided by the Spider (Scrapy-Playwright).
     """
     try:
-        # 💡 FIX: Use response.body for robust, encoding-safe parsing of the rendered HTML
-        soup = BeautifulSoup(response.body, "lxml", from_encoding="utf-8")
+        # The page's <script> elements, collected in the shared single walk.
+        # Element .text is a plain str, which orjson requires (it rejects str subclasses).
+        scripts = page_elements(response)['script']
     except Exception as e:
         return {"error": f"Failed to parse content for schema check: {str(e)}"}
     
     # 1. Look for application/ld+json script tags (most common format)
-    schema_tags = soup.find_all("script", type="application/ld+json")
+    schema_scripts = [tag.text for tag in scripts if tag.get('type') == 'application/ld+json']
     
-    found_types = []
+    # A set from the start: pages often repeat the same type many times
+    found_types = set()
     
-    for tag in schema_tags:
-        # Get the string content of the script tag
-        tag_content = tag.string if tag.string else ""
-        
-        # Clean up common issues like newlines or leading/trailing whitespace
-        clean_content = tag_content.strip()
-
-        if clean_content:
+    for tag_content in schema_scripts:
+        # JSON decoders skip surrounding whitespace themselves, so no stripped copy
+        # is made; blocks that are empty or whitespace-only are simply ignored.
+        if tag_content and not tag_content.isspace():
             try:
                 # Attempt to parse the JSON content
-                data = json.loads(clean_content)
-                
-                # Check for array of schemas (multiple schemas in one script block)
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict) and '@type' in item:
-                            found_types.append(item['@type'])
+                data = orjson.loads(tag_content)
                 
-                # Check for a single schema object
-                elif isinstance(data, dict) and '@type' in data:
-                    schema_type = data['@type']
-                    # Handle single type or array of types (e.g., '@type': ['Article', 'NewsArticle'])
-                    if isinstance(schema_type, list):
-                        found_types.extend(schema_type)
-                    else:
-                        found_types.append(schema_type)
+                # Walk arrays, @graph containers and nested entities for every @type
+                _collect_types(data, found_types)
                 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # If JSON parsing fails, note that schema was present but invalid
-                found_types.append("Invalid JSON-LD")
+                found_types.add("Invalid JSON-LD")
             except Exception as e:
                 # Catch all other exceptions
-                found_types.append(f"JSON-LD Error: {type(e).__name__}")
+                found_types.add(f"JSON-LD Error: {type(e).__name__}")
                 
-    # Use a set to get unique types and sort for clean reporting
-    unique_types = sorted(list(set(found_types)))
+    # Sort the unique types for clean reporting
+    unique_types = sorted(found_types)
 
     # Determine the status
     if len(unique_types) > 0:
@@ -1,27 +1,78 @@
 # checks/ssl_check.py
 
 import ssl, socket
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+# Building a default context loads the system CA bundle from disk, so do it once.
+# SSLContext.wrap_socket is safe to share across calls.
+_SSL_CTX = ssl.create_default_context()
+
+# The certificate is a per-host property, so every page of a domain shares one result.
+# Entries are futures, so a probe started by prefetch() is awaited rather than repeated.
+_SSL_CACHE = {}
+_SSL_CACHE_LOCK = threading.Lock()
+
+# Handshakes for different domains run side by side instead of one after another
+_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='ssl_check')
+
+def reset_cache():
+    """Forgets all memoized domain results (called when a new crawl starts)."""
+    with _SSL_CACHE_LOCK:
+        _SSL_CACHE.clear()
+
+def prefetch(url):
+    """
+    Starts the SSL check for url's domain in the background and returns its future,
+    or None when url is not an HTTPS URL.
+    The spider calls this when it schedules a request, so the handshake overlaps
+    with the page render instead of stalling the checks afterwards.
+    """
+    # Plain-HTTP pages have no certificate to check
+    if not url.startswith('https://'):
+        return None
+    domain = urlparse(url).netloc
+    with _SSL_CACHE_LOCK:
+        future = _SSL_CACHE.get(domain)
+        if future is None:
+            future = _EXECUTOR.submit(_check_domain, domain, url)
+            _SSL_CACHE[domain] = future
+    return future
+
 # FIX: Changed function name and arguments to match the spider's requirement
 def run_audit(response, audit_level):
     """
     Checks the SSL certificate status of the domain using the response URL.
     Uses raw socket check first, then falls back to a requests check.
+    The result is memoized per domain for the rest of the crawl.
     
     This check relies on network protocols and does not require HTML parsing.
     """
-    # Use the response URL to get the base domain
-    domain = urlparse(response.url).netloc
-    
+    # Reuses the domain's prefetched (or already finished) check when there is one
+    future = prefetch(response.url)
+    if future is None:
+        # Skip the handshake (and its 10s timeout) for pages not served over HTTPS
+        return {
+            "valid_ssl": False,
+            "ssl_check_fail": True,
+            "issuer": None,
+            "note": "Site not served over HTTPS.",
+            "error": None
+        }
+    return future.result()
+
+def _check_domain(domain, url):
+    """Performs the actual TLS handshake (and requests fallback) for one domain."""
     # --- Primary Check: Raw Socket SSL ---
     try:
-        ctx = ssl.create_default_context()
-        with ctx.wrap_socket(socket.socket(), server_hostname=domain) as s:
-            s.settimeout(10)
-            s.connect((domain, 443))
-            cert = s.getpeercert()
+        with socket.socket() as sock:
+            # Set the timeout before wrapping so the TLS handshake honours it too
+            sock.settimeout(10)
+            with _SSL_CTX.wrap_socket(sock, server_hostname=domain) as s:
+                s.connect((domain, 443))
+                cert = s.getpeercert()
             
             # Success
             return {
@@ -35,8 +86,9 @@ def run_audit(response, audit_level):
     except Exception as socket_error:
         # --- Fallback Check: Requests ---
         try:
-            # Use requests to verify if HTTPS connection is possible
-            requests.get(response.url, timeout=10, verify=True)
+            # Use requests to verify if HTTPS connection is possible.
+            # HEAD is enough: only the handshake matters, the body would be discarded.
+            requests.head(url, timeout=10, verify=True, allow_redirects=True)
             
             # If requests succeeds, the SSL is valid for HTTPS traffic.
             return {
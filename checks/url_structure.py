@@ -1,5 +1,10 @@
 # checks/url_structure.py
-from urllib.parse import urlparse
+import re
+
+# scheme://netloc, then the path (group 1) and the query string (group 2)
+_URL_RE = re.compile(r'^[^:/?#]+://[^/?#]*([^?#]*)(?:\?([^#]*))?')
+# A non-empty path segment
+_SEGMENT_RE = re.compile(r'[^/]+')
 
 def run_audit(response, audit_level):
     """
@@ -9,36 +14,36 @@ def run_audit(response, audit_level):
     This check relies on the URL from the response object and does not require HTML parsing.
     """
     url = response.url
-    parsed_url = urlparse(url)
+    m = _URL_RE.match(url)
+    path, query = (m.group(1), m.group(2)) if m else ('', None)
     
     # 1. Check for excessive directory depth
-    # Count the number of slashes in the path (excluding the leading and trailing slash)
-    path_segments = [s for s in parsed_url.path.strip('/').split('/') if s]
-    path_depth = len(path_segments)
+    # Count the non-empty path segments (leading, trailing and doubled slashes ignored)
+    path_depth = len(_SEGMENT_RE.findall(path))
     
     # Heuristic: Depth > 2 is often considered deep (e.g., /1/2/3/page.html)
     is_deep = path_depth > 2
     
     # 2. Check for query parameters (a sign of dynamic, potentially messy URLs)
-    has_query_params = bool(parsed_url.query)
+    has_query_params = bool(query)
     
     # 3. Check URL Length
     url_length = len(url)
     # Heuristic: URLs over 100 characters can be less friendly for sharing/indexing
     is_too_long = url_length > 100
 
-    fail_count = 0
-    note = "PASS: URL is clean and follows best practices."
+    # The three signals are independent, so report every one that fires
+    fail_count = is_too_long + is_deep + has_query_params
+    notes = []
 
     if is_too_long:
-        fail_count += 1
-        note = f"FAIL: URL is too long ({url_length} chars). Keep URLs under 100 chars."
-    elif is_deep:
-        fail_count += 1
-        note = f"WARNING: URL has excessive path depth ({path_depth} levels). Aim for shallow structures."
-    elif has_query_params:
-        fail_count += 1
-        note = "WARNING: URL contains query parameters. Use clean slugs instead of parameters when possible."
+        notes.append(f"FAIL: URL is too long ({url_length} chars). Keep URLs under 100 chars.")
+    if is_deep:
+        notes.append(f"WARNING: URL has excessive path depth ({path_depth} levels). Aim for shallow structures.")
+    if has_query_params:
+        notes.append("WARNING: URL contains query parameters. Use clean slugs instead of parameters when possible.")
+
+    note = " | ".join(notes) if notes else "PASS: URL is clean and follows best practices."
         
     return {
         "full_url": url,
@@ -1,21 +1,22 @@
 # crawler/competitor_spider.py
 
 import scrapy
-from scrapy_playwright.page import PageMethod
-import json
+import asyncio
 import logging
 from collections import defaultdict
+from utils.report_writer import dump_json
 
 class CompetitorSpider(scrapy.Spider):
     name = 'competitor_spider'
     
-    # Store all check modules passed from main.py
-    check_modules = []
-    
     def __init__(self, start_url=None, all_checks=None, *args, **kwargs):
         super(CompetitorSpider, self).__init__(*args, **kwargs)
         self.start_urls = [start_url]
-        self.check_modules = all_checks
+        # Resolve each check's report key once (each module only once), the same way
+        # SEOSpider does
+        self._check_dispatch = [
+            (module.__name__.rsplit('.', 1)[-1], module) for module in dict.fromkeys(all_checks or ())
+        ]
         self.max_pages_config = 1 # We only want the competitor's homepage
         self.pages_crawled = 0
         self.competitor_results = []
@@ -27,15 +28,13 @@ class CompetitorSpider(scrapy.Spider):
             callback=self.parse,
             meta={
                 'playwright': True,
-                # Use the 'load' wait_until for a full JavaScript render 
-                'playwright_page_methods': [
-                    PageMethod('wait_for_selector', 'body')
-                ],
+                # Navigation resolves at DOMContentLoaded; no extra selector round-trip
+                'playwright_page_goto_kwargs': {'wait_until': 'domcontentloaded'},
                 'page_type': 'competitor_homepage'
             }
         )
 
-    def parse(self, response):
+    async def parse(self, response):
         """
         Runs all existing SEO checks on the competitor's single page.
         """
@@ -45,19 +44,24 @@ class CompetitorSpider(scrapy.Spider):
         self.pages_crawled += 1
         page_checks = defaultdict(lambda: {'status': 'INFO', 'result': {}, 'error': None})
 
-        # 1. Run all inherited checks
-        for module in self.check_modules:
-            try:
-                # Assuming all check modules have a 'run_audit' method
-                check_name = module.__name__.split('.')[-1]
-                check_result = module.run_audit(response, audit_level='expert') # Run all checks at 'expert' level for best comparison
-                
+        # 1. Run all inherited checks side by side in worker threads, so the ones that
+        # wait on network probes overlap. Parse the shared lxml tree first so the
+        # threads do not race to build it.
+        response.selector
+        check_results = await asyncio.gather(
+            # Run all checks at 'expert' level for best comparison
+            *(asyncio.to_thread(module.run_audit, response, audit_level='expert') for _, module in self._check_dispatch),
+            return_exceptions=True,
+        )
+        for (check_name, module), check_result in zip(self._check_dispatch, check_results):
+            if isinstance(check_result, Exception):
+                self.logger.error(f"Error running check {module.__name__} on competitor: {check_result}")
+                check_entry = page_checks[check_name]
+                check_entry['status'] = 'ERROR'
+                check_entry['error'] = str(check_result)
+            else:
                 # Check results should be a dictionary like {'status': 'FAIL', 'result': {...}}
                 page_checks[check_name].update(check_result)
-            except Exception as e:
-                self.logger.error(f"Error running check {module.__name__} on competitor: {e}")
-                page_checks[module.__name__.split('.')[-1]]['status'] = 'ERROR'
-                page_checks[module.__name__.split('.')[-1]]['error'] = str(e)
         
         # 2. Store the single competitor page result
         self.competitor_results.append({
@@ -74,8 +78,7 @@ class CompetitorSpider(scrapy.Spider):
         """
         if self.competitor_results:
             # Save the results to a temporary JSON file for main.py to load
-            with open('reports/competitor_results.json', 'w', encoding='utf-8') as f:
-                json.dump(self.competitor_results, f, indent=4)
+            dump_json(self.competitor_results, 'reports/competitor_results.json')
         
         self.logger.info(f"Competitor audit finished. Status: {reason}")
       
@@ -1,9 +1,91 @@
 # crawler/spider.py
 
 import scrapy
+import asyncio
+import hashlib
+import re
+from functools import lru_cache
 from urllib.parse import urlparse, urljoin
 import logging
-from scrapy_playwright.page import PageMethod 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from lxml import etree
+from w3lib.url import canonicalize_url
+from checks import ssl_check, robots_sitemap
+from checks._parse import page_text
+
+# Precompiled XPath run on the raw lxml root: no CSS translation, no SelectorList
+# wrapping, and plain str results (no smart-string back-references to the tree)
+_HREF_XPATH = etree.XPath('descendant::a/@href', smart_strings=False)
+# hrefs that are already absolute http(s) URLs; urljoin would return them unchanged
+_ABSOLUTE_PREFIXES = ('http://', 'https://')
+# Upper bound on follow-up requests taken from any single page
+MAX_LINKS_PER_PAGE = 500
+# Links to files that are not HTML pages are never worth a Playwright render.
+# Matched against the end of the path only, so '/file.pdf?dl=1' is skipped too.
+_SKIP_EXTENSIONS = (
+    '.pdf', '.zip', '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico', '.webp',
+    '.css', '.js', '.woff', '.woff2', '.mp3', '.mp4',
+)
+
+# Checks whose result depends only on the page body (never on its URL, status or
+# headers), so byte-identical pages reached through different URLs can share them
+_BODY_ONLY_CHECKS = frozenset((
+    'accessibility_check', 'analytics_check', 'content_quality', 'heading_check',
+    'image_check', 'keyword_analysis', 'meta_check', 'mobile_friendly_check',
+    'og_tags_check', 'schema_check',
+))
+
+# Near-duplicate detection: 64-bit SimHash over word shingles of the page's visible text
+SIMHASH_MAX_DISTANCE = 3
+# The fingerprint is split into MAX_DISTANCE + 1 bands; two fingerprints within the
+# distance must agree exactly on at least one band, so only those are compared
+_SIMHASH_BANDS = SIMHASH_MAX_DISTANCE + 1
+_SIMHASH_BAND_BITS = 64 // _SIMHASH_BANDS
+_SIMHASH_BAND_MASK = (1 << _SIMHASH_BAND_BITS) - 1
+# Script/style bodies and the site-wide header/nav/footer are the same on every page
+# of a site, so they are left out of the fingerprint (same text content_quality reads)
+_SIMHASH_SKIP_TAGS = ("script", "style", "header", "footer", "nav", "noscript")
+# Digits vary between otherwise identical listing pages (page numbers, dates, counts)
+_SIMHASH_TOKEN_RE = re.compile(r'[^\W\d_]+')
+
+def _simhash(text):
+    """
+    Returns the 64-bit SimHash of a page's visible text: digits are ignored and
+    each 3-word shingle votes once. Pages with too few words to shingle return None.
+    """
+    words = _SIMHASH_TOKEN_RE.findall(text.lower())
+    if len(words) < 3:
+        return None
+    shingles = {' '.join(words[i:i + 3]) for i in range(len(words) - 2)}
+    # One 64-character bit string per shingle; zip(*...) turns them into bit columns
+    rows = [
+        format(int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big'), '064b')
+        for shingle in shingles
+    ]
+    half = len(rows) / 2
+    fingerprint = 0
+    for column in zip(*rows):
+        fingerprint = (fingerprint << 1) | (column.count('1') > half)
+    return fingerprint
+
+def _page_fingerprint(response):
+    """SimHash of the response's visible text, without the site-wide chrome."""
+    return _simhash(page_text(response, _SIMHASH_SKIP_TAGS))
+
+# Site-wide nav and footer links resolve to the same absolute URLs on every page, so
+# memoize the canonicalization; bounded so a large crawl cannot grow it without limit
+@lru_cache(maxsize=4096)
+def _url_key(url):
+    """
+    Returns the crawl-dedup key of url: an 8-byte digest of its canonical form
+    (sorted query, no fragment, lower-case host). A 64-bit digest cannot collide in
+    practice at crawl sizes, and keeps the frontier's memory per URL small and fixed
+    however long the URL is.
+    """
+    return hashlib.blake2b(canonicalize_url(url).encode(), digest_size=8).digest()
+
 
 class SEOSpider(scrapy.Spider):
     name = "seospider"
@@ -14,6 +96,11 @@ class SEOSpider(scrapy.Spider):
         audit_level = settings.get('AUDIT_LEVEL', 'standard')
         audit_scope = settings.get('AUDIT_SCOPE', 'only_onpage')
         
+        # Per-domain SSL and robots/sitemap results are memoized at module level;
+        # start each crawl fresh
+        ssl_check.reset_cache()
+        robots_sitemap.reset_cache()
+        
         instance = super().from_crawler(crawler, *args, **kwargs, 
                                         audit_level=audit_level, 
                                         audit_scope=audit_scope)
@@ -27,11 +114,38 @@ class SEOSpider(scrapy.Spider):
         self.start_urls = [start_url]
         # Use a list for allowed_domains for consistency
         self.allowed_domains = [urlparse(start_url).netloc]
+        # Same-domain test for followed links without re-parsing every href:
+        # an absolute URL is internal if it is exactly the bare origin of any allowed
+        # domain or continues one (a single C-level startswith over the whole tuple)
+        self._domain_exact = frozenset(
+            f"{scheme}://{domain}" for domain in self.allowed_domains for scheme in ('http', 'https')
+        )
+        self._domain_prefixes = tuple(
+            origin + sep for origin in sorted(self._domain_exact) for sep in ('/', '?', '#')
+        )
         self.max_pages_config = max_pages_config
         self.pages_crawled = 0
         self.audit_level = audit_level 
         self.audit_scope = audit_scope 
         self.all_checks_modules = all_checks
+        # Resolve each check's report key and entry point once instead of on every page.
+        # A module listed twice would run twice per page only to overwrite its own
+        # result, so the table keeps the first occurrence of each.
+        self._check_dispatch = [
+            (m.__name__.rsplit('.', 1)[-1], getattr(m, 'run_audit', None))
+            for m in dict.fromkeys(all_checks)
+        ]
+        # Dedup key of every URL already scheduled, so repeats are dropped before a
+        # Request is even built
+        self._seen_urls = {_url_key(url) for url in self.start_urls}
+        # One worker pool for the whole crawl, sized so a page's checks can all run at once
+        self._check_pool = ThreadPoolExecutor(
+            max_workers=len(self._check_dispatch) or 1, thread_name_prefix='seo_check'
+        )
+        # Body digest -> {check_key: result} for the body-only checks already run
+        self._body_results = {}
+        # SimHash band value -> [(fingerprint, url)] of the pages whose checks were run
+        self._simhash_bands = [{} for _ in range(_SIMHASH_BANDS)]
         
         logging.info(f"Spider initialized with Audit Level: {self.audit_level} and Scope: {self.audit_scope}")
 
@@ -41,6 +155,12 @@ class SEOSpider(scrapy.Spider):
         the page is fully rendered before scraping, as the initial URL's type is unknown.
         """
         for url in self.start_urls:
+            # Start the per-domain network probes now so they overlap with browser
+            # start-up and the Playwright render
+            if ssl_check in self.all_checks_modules:
+                ssl_check.prefetch(url)
+            if robots_sitemap in self.all_checks_modules:
+                robots_sitemap.prefetch(url)
             yield scrapy.Request(
                 url, 
                 callback=self.parse, 
@@ -49,14 +169,13 @@ class SEOSpider(scrapy.Spider):
                 meta={
                     # Force Playwright rendering
                     'playwright': True, 
-                    'playwright_page_methods': [
-                        PageMethod('wait_for_selector', 'body') 
-                    ]
+                    # Navigation resolves at DOMContentLoaded; no extra selector round-trip
+                    'playwright_page_goto_kwargs': {'wait_until': 'domcontentloaded'}
                 }, 
                 dont_filter=True
             ) 
 
-    def parse(self, response):
+    async def parse(self, response):
         self.pages_crawled += 1
         logging.info(f"Crawled page {self.pages_crawled}/{self.max_pages_config}: {response.url}")
 
@@ -79,45 +198,152 @@ class SEOSpider(scrapy.Spider):
             'is_crawlable': True
         }
 
-        # Run Checks using the 'run_audit' function
-        for check_module in self.all_checks_modules:
-            module_name = check_module.__name__
-            check_key = module_name.split('.')[-1]
-            try:
-                # Passes the Playwright-rendered response
-                check_results = check_module.run_audit(response, self.audit_level) 
-                page_audit_results['checks'][check_key] = check_results
-            except AttributeError as e:
-                # Error: Function missing
-                page_audit_results['checks'][check_key] = {
-                    'error': f"MODULE ERROR: {e}. Check module '{check_key}' is likely missing the required **'run_audit(response, audit_level)'** function."
-                }
-            except Exception as e:
-                # Error: Unhandled exception during check execution
-                page_audit_results['checks'][check_key] = {'error': f"Unhandled exception during check: {str(e)}"}
+        # Run Checks using the 'run_audit' function.
+        # Templated duplicates (UTM variants, pagination aliases) often render byte-identical
+        # HTML: body-only checks are reused from the first page with the same digest.
+        body_digest = hashlib.blake2b(response.body, digest_size=16).digest()
+        cached = self._body_results.get(body_digest, {})
+        # Pagination, tag and facet pages whose visible text differs only in a few words
+        # are near-duplicates of the first such page: they are marked duplicate_of and
+        # skip the body-only checks (no results are borrowed from that page), while the
+        # URL/header checks (canonical, redirect, ...) still run for them
+        fingerprint = duplicate_of = None
+        if not cached:
+            # The text walk and shingle hashing are CPU work; keep them off the reactor
+            response.selector
+            fingerprint = await asyncio.wrap_future(self._check_pool.submit(_page_fingerprint, response))
+            duplicate_of = None if fingerprint is None else self._find_near_duplicate(fingerprint)
+        if duplicate_of:
+            logging.info(f"Skipping body-only checks for {response.url}: near-duplicate of {duplicate_of}")
+            page_audit_results['duplicate_of'] = duplicate_of
+
+        await self._run_checks(
+            response, page_audit_results, body_digest, cached,
+            skip=_BODY_ONLY_CHECKS if duplicate_of else frozenset(),
+        )
+        if fingerprint is not None and not duplicate_of:
+            self._remember_fingerprint(fingerprint, response.url)
 
         yield page_audit_results 
 
         # Link following logic for deep crawl scopes
         if self.pages_crawled < self.max_pages_config and self.audit_scope != 'only_onpage':
-            # Use response.css('a::attr(href)').getall() for robust link extraction
-            for href in response.css('a::attr(href)').getall():
-                url = urljoin(response.url, href)
-                parsed_url = urlparse(url)
-                
-                # Check if link is internal and a standard web link
-                if parsed_url.netloc == self.allowed_domains[0] and parsed_url.scheme in ['http', 'https']:
-                    # Use response.follow for cleaner link creation
-                    yield response.follow(
-                        url, 
-                        callback=self.parse, 
-                        errback=self.handle_error, # Critical: Add error handling
-                        meta={
-                            # CRITICAL: Force Playwright rendering for every link as requested
-                            'playwright': True, 
-                            'playwright_page_methods': [PageMethod('wait_for_selector', 'body')]
-                        }
-                    )
+            # Build the follow-ups in one batch, capped so a page with thousands of
+            # anchors cannot flood the scheduler
+            for request in response.follow_all(
+                islice(self._internal_links(response), MAX_LINKS_PER_PAGE),
+                callback=self.parse, 
+                errback=self.handle_error, # Critical: Add error handling
+                meta={
+                    # CRITICAL: Force Playwright rendering for every link as requested
+                    'playwright': True, 
+                    'playwright_page_goto_kwargs': {'wait_until': 'domcontentloaded'}
+                }
+            ):
+                yield request
+
+    async def _run_checks(self, response, page_audit_results, body_digest, cached, skip=frozenset()):
+        """
+        Runs every check not already in cached (and not in skip) on the shared pool and
+        fills page_audit_results['checks'] in dispatch order, leaving skipped checks out.
+        """
+        # The checks are independent (several just wait on network probes), so they run
+        # side by side on the shared pool and the reactor keeps serving other pages while
+        # they do. Parse the shared lxml tree first so the threads do not race to build it.
+        response.selector
+        pending = [
+            (check_key, self._check_pool.submit(self._run_check, check_key, run_audit, response))
+            for check_key, run_audit in self._check_dispatch
+            if check_key not in cached and check_key not in skip
+        ]
+        fresh = dict(zip(
+            (check_key for check_key, _ in pending),
+            await asyncio.gather(*(asyncio.wrap_future(future) for _, future in pending)),
+        ))
+        # Collect in dispatch order so the report layout stays stable
+        checks_out = page_audit_results['checks']
+        for check_key, _ in self._check_dispatch:
+            if check_key in skip:
+                continue
+            checks_out[check_key] = cached[check_key] if check_key in cached else fresh[check_key]
+
+        if not cached and not skip:
+            self._body_results[body_digest] = {
+                key: result for key, result in checks_out.items() if key in _BODY_ONLY_CHECKS
+            }
+
+    def _find_near_duplicate(self, fingerprint):
+        """Returns the URL of an audited page within SIMHASH_MAX_DISTANCE bits of fingerprint, or None."""
+        for band, table in enumerate(self._simhash_bands):
+            key = (fingerprint >> (band * _SIMHASH_BAND_BITS)) & _SIMHASH_BAND_MASK
+            for other, url in table.get(key, ()):
+                if bin(fingerprint ^ other).count('1') <= SIMHASH_MAX_DISTANCE:
+                    return url
+        return None
+
+    def _remember_fingerprint(self, fingerprint, url):
+        """Indexes an audited page's fingerprint under each of its bands."""
+        for band, table in enumerate(self._simhash_bands):
+            key = (fingerprint >> (band * _SIMHASH_BAND_BITS)) & _SIMHASH_BAND_MASK
+            table.setdefault(key, []).append((fingerprint, url))
+
+    def closed(self, reason):
+        """Releases the check worker threads once the crawl is over."""
+        self._check_pool.shutdown(wait=False)
+
+    def _internal_links(self, response):
+        """
+        Yields each absolute http/https URL on the page that stays on the crawl
+        domain and has not been scheduled before in this crawl, in document order.
+        """
+        # Bind the per-crawl lookups once; they are hit for every anchor on the page
+        base_url = response.url
+        domain_prefixes = self._domain_prefixes
+        domain_exact = self._domain_exact
+        seen_urls = self._seen_urls
+        # Nav/footer links repeat many times per page; resolve each distinct href only once
+        seen_hrefs = set()
+        # Extract every anchor href straight from the parsed tree
+        for href in _HREF_XPATH(response.selector.root):
+            # Empty and fragment-only hrefs point back at this page; skip them before joining
+            if not href or href[0] == '#' or href in seen_hrefs:
+                continue
+            seen_hrefs.add(href)
+            url = href if href.startswith(_ABSOLUTE_PREFIXES) else urljoin(base_url, href)
+            
+            # Check if link is internal and a standard web link (http/https on our domain)
+            if not (url.startswith(domain_prefixes) or url in domain_exact):
+                continue
+            # Skip documents, images and assets (one C-level endswith over the tuple)
+            path = url.partition('#')[0].partition('?')[0]
+            if path.lower().endswith(_SKIP_EXTENSIONS):
+                continue
+            # Skip pages already scheduled from this or any earlier page (which also
+            # drops different hrefs on this page that resolve to the same URL)
+            key = _url_key(url)
+            if key in seen_urls:
+                continue
+            seen_urls.add(key)
+            yield url
+
+    def _run_check(self, check_key, run_audit, response):
+        """
+        Runs one check's run_audit on the response and returns its result dict,
+        turning a missing entry point or an unhandled exception into an error entry.
+        """
+        try:
+            if run_audit is None:
+                raise AttributeError(f"module 'checks.{check_key}' has no attribute 'run_audit'")
+            # Passes the Playwright-rendered response
+            return run_audit(response, self.audit_level) 
+        except AttributeError as e:
+            # Error: Function missing
+            return {
+                'error': f"MODULE ERROR: {e}. Check module '{check_key}' is likely missing the required **'run_audit(response, audit_level)'** function."
+            }
+        except Exception as e:
+            # Error: Unhandled exception during check execution
+            return {'error': f"Unhandled exception during check: {str(e)}"}
 
     def handle_error(self, failure):
         """
@@ -0,0 +1,21 @@
+# utils/feed_exporter.py
+
+import orjson
+from scrapy.exporters import JsonLinesItemExporter
+from scrapy.utils.serialize import ScrapyJSONEncoder
+
+class OrjsonLinesItemExporter(JsonLinesItemExporter):
+    """
+    JSON Lines feed exporter that encodes each item with orjson, writing UTF-8 bytes
+    straight to the feed file.
+    """
+
+    def __init__(self, file, **kwargs):
+        super().__init__(file, **kwargs)
+        # Values orjson cannot encode natively (sets, Decimals, Items, ...) are
+        # converted the same way Scrapy's own JSON exporter converts them
+        self._default = ScrapyJSONEncoder().default
+
+    def export_item(self, item):
+        itemdict = dict(self.get_serialized_fields(item))
+        self.file.write(orjson.dumps(itemdict, default=self._default, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
@@ -1,9 +1,9 @@
 # utils/report_writer.py
 
-import json
 import datetime
 import re
 import logging
+import orjson
 from urllib.parse import urlparse
 from collections import defaultdict
 
@@ -132,11 +132,28 @@ def get_check_aggregation(initial_checks: dict, crawled_pages: list) -> dict:
     
     return dict(aggregated_counts)
 
+def dump_json(data, file_path: str):
+    """
+    Writes data to file_path as 2-space indented JSON (UTF-8), using orjson.
+    """
+    with open(file_path, 'wb') as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+
+def iter_json_lines(file_path: str):
+    """
+    Yields the items of a JSON Lines file one by one, decoding each line with orjson.
+    A bad line raises orjson.JSONDecodeError (a json.JSONDecodeError subclass) after
+    every item before it has been yielded.
+    """
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
 def write_json_report(structured_report_data: dict, file_path: str):
     """Writes the full structured data to a JSON file."""
     try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(structured_report_data, f, indent=4)
+        dump_json(structured_report_data, file_path)
         logging.info(f"JSON Report written successfully to: {file_path}")
     except Exception as e:
         logging.error(f"Failed to write JSON report: {e}")
@@ -263,8 +280,14 @@ def write_markdown_report(report, md_path):
         content.append(f"\n# 📍 PAGE AUDIT {idx + 1}: {page_url}\n")
         content.append(f"**HTTP Status Code:** `{status_code}`\n")
         content.append("---")
+
+        # Near-duplicates only carry the URL/header checks that were run for them
+        check_keys = ALL_CHECK_KEYS
+        if page.get('duplicate_of'):
+            content.append(f"\n**Near-duplicate of:** {page['duplicate_of']}. Content checks were not re-run; see that page's results. URL checks were run for this one.\n")
+            check_keys = [key for key in ALL_CHECK_KEYS if key in page_checks]
         
-        for key in ALL_CHECK_KEYS:
+        for key in check_keys:
             data = page_checks.get(key, {}) 
             check_name = key.replace('_', ' ').title()
             